@@ -6,7 +6,7 @@ import detectree as dtr
 import rasterio
 import numpy as np
 from utils.paths import get_data_folder
-from utils.inputs import user_input, UserInput
+from utils.inputs import user_input, UserInput, configure_logging
 
 
 logger = logging.getLogger(__name__)
@@ -107,6 +107,7 @@ class DetectTrees:
         self.mask_saver()
 
 if __name__ == "__main__":
+    configure_logging()
     user_input = user_input()
     raw_folder = get_data_folder("raw")
 
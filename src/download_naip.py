@@ -2,7 +2,7 @@ import logging
 from pathlib import Path
 import requests
 from utils.paths import get_data_folder
-from utils.inputs import user_input, UserInput
+from utils.inputs import user_input, UserInput, configure_logging
 from utils.geometry import bounding_box_mercator, tile_calculator, BoundingBoxMercator
 
 
@@ -112,6 +112,7 @@ class DownloadNaip:
         self.naip_save()
 
 if __name__ == "__main__":
+    configure_logging()
     user_input = user_input()
     bbox_mercator = bounding_box_mercator(user_input)
     width, height = tile_calculator(bbox_mercator, user_input.resolution)
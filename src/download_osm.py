@@ -2,7 +2,7 @@ import logging
 from pathlib import Path
 import osmnx as ox
 from utils.paths import get_data_folder
-from utils.inputs import user_input, UserInput
+from utils.inputs import user_input, UserInput, configure_logging
 from utils.geometry import bounding_box_osm
 
 
@@ -112,6 +112,7 @@ class DownloadOsm:
             self.osm_visualize()
 
 if __name__ == "__main__":
+    configure_logging()
     user_input = user_input()
     bbox_osm = bounding_box_osm(user_input)
     raw_folder = get_data_folder("raw")
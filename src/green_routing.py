@@ -4,7 +4,7 @@ import geopandas as gpd
 import networkx as nx
 from shapely.ops import linemerge
 from utils.paths import get_data_folder
-from utils.inputs import user_input, UserInput
+from utils.inputs import user_input, UserInput, configure_logging
 
 
 logger = logging.getLogger(__name__)
@@ -170,6 +170,7 @@ class GreenRouting:
         self.save_route()
 
 if __name__ == "__main__":
+    configure_logging()
     user_input = user_input()
     raw_folder = get_data_folder("raw")
     processed_folder = get_data_folder("processed")
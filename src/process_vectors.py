@@ -3,7 +3,7 @@ from pathlib import Path
 from functools import wraps
 import geopandas as gpd
 from utils.paths import get_data_folder
-from utils.inputs import user_input, UserInput
+from utils.inputs import user_input, UserInput, configure_logging
 from utils.geometry import (
     raster_to_vector,
     add_id,
@@ -179,6 +179,7 @@ class ProcessVectors:
         self._process_step(areas_calculated_path, self.calculate_areas, "Area calculation", overwrite)
 
 if __name__ == "__main__":
+    configure_logging()
     user_input = user_input()
     raw_folder = get_data_folder("raw")
 
@@ -1,7 +1,7 @@
 import logging
 from pathlib import Path
 from utils.paths import get_data_folder
-from utils.inputs import user_input, UserInput
+from utils.inputs import user_input, UserInput, configure_logging
 from utils.geometry import reproject_raster_layer, reproject_vector_layer
 
 
@@ -75,6 +75,7 @@ class ReprojectLayers:
         self.reproject_all_layers()
 
 if __name__ == "__main__":
+    configure_logging()
     user_input = user_input()
     dst_crs = 'EPSG:5070' # EPSG:5070 for testing. Later it can change dynamically.
     raw_folder = get_data_folder("raw")
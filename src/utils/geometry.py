@@ -3,22 +3,53 @@ Geometry utilities for performing geospatial coordinate transformations,
 tiling calculations, and other spatial processing steps used in the pipeline.
 """
 
+import importlib.util
 import logging
+import math
+import os
+import re
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
 from dataclasses import dataclass
 from pyproj import Transformer
-from utils.inputs import user_input, UserInput
+from utils.inputs import user_input, UserInput, MIN_RESOLUTION
+from utils.transformer import transformer_from_crs
 import geopandas as gpd
 import numpy as np
 import rasterio
+import rasterio.shutil
+import shapely
+from rasterio._err import CPLE_BaseError
+from rasterio.crs import CRS
 from rasterio.features import shapes
-from shapely.geometry import shape
-from rasterio.warp import calculate_default_transform, reproject, Resampling
+from rasterio.enums import Resampling
+from rasterio.vrt import WarpedVRT
 
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Arrow-backed pyogrio reads skip building Python objects per feature, but
+# need pyarrow; fall back to the plain pyogrio reader when it is missing.
+_USE_ARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Smallest number of geometries worth handing to a separate worker thread
+_MIN_GEOMETRIES_PER_WORKER = 1000
+
+# Masks up to this many polygons are dissolved and prepared once for clipping;
+# larger masks are matched per feature through a spatial index instead
+_MAX_DISSOLVED_MASK_PARTS = 100
+
+# Spherical Web Mercator (EPSG:3857) sphere radius in meters and the latitude
+# limit beyond which the projection diverges towards infinity
+_MERCATOR_RADIUS = 6378137.0
+_MERCATOR_MAX_LAT = 85.05112878
+
+# Plain "EPSG:<code>" strings are resolved by code, skipping the full CRS string parser
+_EPSG_CODE = re.compile(r"EPSG:(\d+)", re.IGNORECASE)
+
+@dataclass(slots=True, frozen=True)
 class BoundingBoxMercator:
     """
     Web Mercator representation of a geographic bounding box.
@@ -29,6 +60,40 @@ class BoundingBoxMercator:
     xmax: float
     ymax: float
 
+@dataclass(slots=True, frozen=True, eq=False)
+class BoundingBoxMercatorArray:
+    """
+    Web Mercator bounding boxes for many AOIs stored as one array per coordinate.
+    Lets tile sizes for all boxes be computed with single NumPy expressions.
+    Compared and hashed by identity, since ndarray fields have no scalar equality.
+    """
+    xmin: np.ndarray
+    ymin: np.ndarray
+    xmax: np.ndarray
+    ymax: np.ndarray
+
+    @classmethod
+    def from_boxes(cls, boxes: list[BoundingBoxMercator]) -> "BoundingBoxMercatorArray":
+        """Pack a list of BoundingBoxMercator objects into coordinate arrays."""
+        coords = np.array(
+            [(box.xmin, box.ymin, box.xmax, box.ymax) for box in boxes],
+            dtype=np.float64).reshape(-1, 4).T.copy()
+        return cls(xmin=coords[0], ymin=coords[1], xmax=coords[2], ymax=coords[3])
+
+    def __len__(self) -> int:
+        return len(self.xmin)
+
+def _lonlat_to_mercator(lon: float, lat: float) -> tuple[float, float]:
+    """
+    Project a single WGS84 coordinate to spherical Web Mercator in closed form.
+    Latitude is clipped to the Web Mercator limit so poles stay finite.
+    """
+    lat = min(max(lat, -_MERCATOR_MAX_LAT), _MERCATOR_MAX_LAT)
+    x = _MERCATOR_RADIUS * math.radians(lon)
+    # atanh(sin(lat)) equals ln(tan(pi/4 + lat/2)) but is exactly 0 at the equator
+    y = _MERCATOR_RADIUS * math.atanh(math.sin(math.radians(lat)))
+    return x, y
+
 def bounding_box_mercator(user_input: UserInput) -> BoundingBoxMercator:
     """
     Convert user-defined WGS84 bounding box into Web Mercator coordinates.
@@ -40,58 +105,211 @@ def bounding_box_mercator(user_input: UserInput) -> BoundingBoxMercator:
         BoundingBoxMercator: Bounding box in EPSG:3857 (Web Mercator).
     """
 
-    sw_lon = user_input.sw_lon
-    sw_lat = user_input.sw_lat
-    ne_lon = user_input.ne_lon
-    ne_lat = user_input.ne_lat
-
-    transformer = Transformer.from_crs("EPSG:4326", "EPSG:3857", always_xy=True)
-
-    xmin, ymin = transformer.transform(sw_lon, sw_lat)
-    xmax, ymax = transformer.transform(ne_lon, ne_lat)
+    xmin, ymin = _lonlat_to_mercator(user_input.sw_lon, user_input.sw_lat)
+    xmax, ymax = _lonlat_to_mercator(user_input.ne_lon, user_input.ne_lat)
 
     return BoundingBoxMercator(
-        xmin = xmin, 
+        xmin = xmin,
         ymin = ymin,
         xmax = xmax,
         ymax = ymax)
 
-def tile_calculator(bbox_mercator: BoundingBoxMercator, resolution: float) -> tuple[int, int]:
+def bounding_box_mercator_batch(user_inputs: list[UserInput]) -> BoundingBoxMercatorArray:
+    """
+    Convert many user-defined WGS84 bounding boxes into Web Mercator coordinates at once.
+
+    Uses the same closed-form spherical Mercator as bounding_box_mercator,
+    evaluated with NumPy over all corners in one pass.
+
+    Parameters:
+        user_inputs (list[UserInput]): User-provided spatial extents.
+
+    Returns:
+        BoundingBoxMercatorArray: Bounding boxes in EPSG:3857 (Web Mercator).
+    """
+    corners = np.array(
+        [(ui.sw_lon, ui.sw_lat, ui.ne_lon, ui.ne_lat) for ui in user_inputs],
+        dtype=np.float64).reshape(-1, 4)
+
+    lons = corners[:, 0::2]
+    lats = np.clip(corners[:, 1::2], -_MERCATOR_MAX_LAT, _MERCATOR_MAX_LAT)
+
+    xs = _MERCATOR_RADIUS * np.radians(lons)
+    ys = _MERCATOR_RADIUS * np.arctanh(np.sin(np.radians(lats)))
+
+    return BoundingBoxMercatorArray(
+        xmin = xs[:, 0].copy(),
+        ymin = ys[:, 0].copy(),
+        xmax = xs[:, 1].copy(),
+        ymax = ys[:, 1].copy())
+
+def batch_project(lons: np.ndarray, lats: np.ndarray, src_crs: str = "EPSG:4326", dst_crs: str = "EPSG:3857") -> tuple[np.ndarray, np.ndarray]:
+    """
+    Project arrays of coordinates from one CRS to another in a single call.
+
+    Parameters:
+        lons (np.ndarray): X coordinates (longitudes for geographic CRSs).
+        lats (np.ndarray): Y coordinates (latitudes for geographic CRSs).
+        src_crs (str): Source coordinate reference system (default 'EPSG:4326').
+        dst_crs (str): Target coordinate reference system (default 'EPSG:3857').
+
+    Raises:
+        ValueError: If lons and lats do not have the same shape.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Projected (x, y) coordinate arrays.
+    """
+    lons = np.asarray(lons, dtype=np.float64)
+    lats = np.asarray(lats, dtype=np.float64)
+
+    if lons.shape != lats.shape:
+        raise ValueError("Longitude and latitude arrays must have the same shape")
+
+    xs, ys = transformer_from_crs(src_crs, dst_crs).transform(lons, lats)
+    return np.asarray(xs), np.asarray(ys)
+
+def _tile_dims(xmin: float, ymin: float, xmax: float, ymax: float, resolution: float, block_align: int = 0) -> tuple[int, int, int]:
+    """
+    Compute pixel dimensions of a bounding box together with a status code.
+
+    Status codes: 0 = valid, 1 = width or height below 1 pixel,
+    2 = width or height above the 2500 pixel limit. Keeping the arithmetic
+    free of exceptions lets callers format error messages only on failure.
+    A non-zero block_align rounds both dimensions up to a multiple of it
+    before the limits are checked.
+    """
+    # One reciprocal instead of a divide per dimension; round half up to the
+    # nearest pixel, math.floor already returns an int
+    inv_res = 1.0 / resolution
+    width  = math.floor((xmax - xmin) * inv_res + 0.5)
+    height = math.floor((ymax - ymin) * inv_res + 0.5)
+
+    if block_align and width >= 1 and height >= 1:
+        width  = -(-width // block_align) * block_align
+        height = -(-height // block_align) * block_align
+
+    # Common case first: a single combined range check
+    if 1 <= width <= 2500 and 1 <= height <= 2500:
+        return width, height, 0
+    if width < 1 or height < 1:
+        return width, height, 1
+    return width, height, 2
+
+def tile_calculator(bbox_mercator: BoundingBoxMercator, resolution: float, block_align: int = 0) -> tuple[int, int]:
     """
     Compute output raster width and height (in pixels) from a
     Web Mercator bounding box and a target spatial resolution.
 
+    A non-zero block_align rounds both dimensions up to a multiple of the
+    GeoTIFF block size for tiled output, keeping the bounding box.
+
     Parameters:
         bbox_mercator (BoundingBoxMercator): Bounding box in EPSG:3857.
         resolution (float): Target resolution in meters per pixel.
+        block_align (int): Block size to round dimensions up to; 0 disables alignment.
+
+    Raises:
+        ValueError: If block_align is negative.
+        ValueError: If the width or height is smaller than 1 pixel.
+        ValueError: If the (aligned) width or height exceeds 2500 pixels.
+        ValueError: If block alignment makes the effective resolution finer than 0.6m.
 
     Returns:
         Tuple[int, int]: (width, height) in pixels.
     """
+    if block_align < 0:
+        raise ValueError(f"block_align must be >= 0. Got: {block_align}")
 
-    xmin = bbox_mercator.xmin
-    ymin = bbox_mercator.ymin
-    xmax = bbox_mercator.xmax
-    ymax = bbox_mercator.ymax
-
-    width  = int(round((xmax - xmin) / resolution))
-    height = int(round((ymax - ymin) / resolution))
+    width, height, status = _tile_dims(
+        bbox_mercator.xmin, bbox_mercator.ymin, bbox_mercator.xmax, bbox_mercator.ymax, resolution, block_align)
 
-    if width < 1 or height < 1:
+    if status == 1:
         raise ValueError(
             f"Width and height (pixel count) must be >= 1. "
             f"Width: {width}, height: {height}")
 
-    if width >2500 or height > 2500:
+    if status == 2:
         raise ValueError(
             f"Tile size too large: maximum allowed is 2500x2500 pixels. "
             f"Width: {width}, height: {height}")
 
-    logger.info("Width: %d", width)
-    logger.info("Height: %d", height) 
+    if block_align:
+        effective_resolution = min(
+            (bbox_mercator.xmax - bbox_mercator.xmin) / width,
+            (bbox_mercator.ymax - bbox_mercator.ymin) / height)
+        if effective_resolution < MIN_RESOLUTION:
+            raise ValueError(
+                f"Block-aligned tile is finer than the {MIN_RESOLUTION}m NAIP resolution. "
+                f"Width: {width}, height: {height}, effective resolution: {effective_resolution:.3f}m")
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Width: %d", width)
+        logger.info("Height: %d", height)
 
     return width, height
 
+def tile_calculator_batch(bboxes_mercator: BoundingBoxMercatorArray, resolution: float | np.ndarray, block_align: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute output raster widths and heights (in pixels) for many
+    Web Mercator bounding boxes at once.
+
+    Parameters:
+        bboxes_mercator (BoundingBoxMercatorArray): Bounding boxes in EPSG:3857.
+        resolution (float | np.ndarray): Target resolution in meters per pixel,
+                                         either one value or one per box.
+        block_align (int): Block size to round dimensions up to; 0 disables alignment.
+
+    Raises:
+        ValueError: If block_align is negative.
+        ValueError: If any box is smaller than 1 pixel in width or height.
+        ValueError: If any box exceeds 2500 pixels in width or height.
+        ValueError: If block alignment makes any box finer than 0.6m per pixel.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (widths, heights) in pixels as int64 arrays.
+    """
+    if block_align < 0:
+        raise ValueError(f"block_align must be >= 0. Got: {block_align}")
+
+    extent_x = bboxes_mercator.xmax - bboxes_mercator.xmin
+    extent_y = bboxes_mercator.ymax - bboxes_mercator.ymin
+
+    inv_res = 1.0 / np.asarray(resolution, dtype=np.float64)
+    widths = np.floor(extent_x * inv_res + 0.5).astype(np.int64)
+    heights = np.floor(extent_y * inv_res + 0.5).astype(np.int64)
+
+    if block_align:
+        positive = (widths >= 1) & (heights >= 1)
+        widths = np.where(positive, -(-widths // block_align) * block_align, widths)
+        heights = np.where(positive, -(-heights // block_align) * block_align, heights)
+
+    valid = (widths >= 1) & (widths <= 2500) & (heights >= 1) & (heights <= 2500)
+    if not valid.all():
+        too_small = (widths < 1) | (heights < 1)
+        if too_small.any():
+            i = int(np.argmax(too_small))
+            raise ValueError(
+                f"Width and height (pixel count) must be >= 1. "
+                f"Width: {widths[i]}, height: {heights[i]} (box {i})")
+
+        # Every remaining invalid box is too large
+        i = int(np.argmax(~valid))
+        raise ValueError(
+            f"Tile size too large: maximum allowed is 2500x2500 pixels. "
+            f"Width: {widths[i]}, height: {heights[i]} (box {i})")
+
+    if block_align:
+        effective_resolution = np.minimum(extent_x / widths, extent_y / heights)
+        too_fine = effective_resolution < MIN_RESOLUTION
+        if too_fine.any():
+            i = int(np.argmax(too_fine))
+            raise ValueError(
+                f"Block-aligned tile is finer than the {MIN_RESOLUTION}m NAIP resolution. "
+                f"Width: {widths[i]}, height: {heights[i]}, "
+                f"effective resolution: {effective_resolution[i]:.3f}m (box {i})")
+
+    return widths, heights
+
 def bounding_box_osm(user_input: UserInput) -> tuple[float, float, float, float]:
     """
     Construct an OpenStreetMap-compatible bounding box (WGS84) from user input.
@@ -109,42 +327,103 @@ def bounding_box_osm(user_input: UserInput) -> tuple[float, float, float, float]
     xmax = user_input.ne_lon
     ymax = user_input.ne_lat
 
-    bbox_osm = (float(xmin), float(ymin), float(xmax), float(ymax))
+    bbox_osm = (xmin, ymin, xmax, ymax)
     logger.info("OSM bounding box (WGS84): West: %s, South: %s, East: %s, North: %s", xmin, ymin, xmax, ymax)
     return bbox_osm
 
-def reproject_raster_layer(dst_crs: str, input_raster: Path, output_raster: Path) -> None:
+def _parse_crs(crs: str | int | CRS) -> CRS:
+    """
+    Build a rasterio CRS, taking the EPSG-code fast path for ints and
+    'EPSG:<code>' strings. CRS objects are returned unchanged; other strings
+    (WKT, PROJ strings, malformed codes such as 'EPSG:INVALID') go through
+    CRS.from_string, and any other input through CRS.from_user_input.
+    """
+    if isinstance(crs, CRS):
+        return crs
+    if isinstance(crs, int):
+        return CRS.from_epsg(crs)
+    if isinstance(crs, str):
+        match = _EPSG_CODE.fullmatch(crs)
+        if match:
+            return CRS.from_epsg(int(match.group(1)))
+        return CRS.from_string(crs)
+    return CRS.from_user_input(crs)
+
+@contextmanager
+def reproject_raster_layer_vrt(dst_crs: str | int | CRS, input_raster: Path) -> Iterator[WarpedVRT]:
+    """
+    Open a raster reprojected on the fly to a target CRS, without writing a file.
+
+    The WarpedVRT is only valid inside the with-block, because it reads from
+    the source dataset that this context manager keeps open.
+
+    Parameters:
+        dst_crs (str | int | CRS): Target coordinate reference system (e.g. 'EPSG:5070', 5070 or a CRS).
+        input_raster (Path): Path to the input raster file.
+
+    Returns:
+        Iterator[WarpedVRT]: Context manager yielding the reprojected virtual dataset.
+    """
+    with rasterio.open(input_raster) as src, WarpedVRT(
+            src, crs=_parse_crs(dst_crs), resampling=Resampling.nearest, NUM_THREADS="ALL_CPUS") as vrt:
+        yield vrt
+
+def reproject_raster_layer(dst_crs: str | int | CRS, input_raster: Path, output_raster: Path) -> None:
     """
     Reproject a raster to a target CRS and save the output as a new file.
 
+    The output is written as a Cloud Optimized GeoTIFF (tiled, ZSTD
+    compressed, with overviews for large rasters), so tile servers and
+    windowed readers can use it without another conversion pass.
+    Callers that only read the reprojected pixels should use
+    reproject_raster_layer_vrt instead and skip the file entirely.
+
     Parameters:
-        dst_crs (str): Target coordinate reference system (e.g. 'EPSG:5070').
+        dst_crs (str | int | CRS): Target coordinate reference system (e.g. 'EPSG:5070', 5070 or a CRS).
         input_raster (Path): Path to the input raster file.
         output_raster (Path): Path where the reprojected raster will be saved.
 
+    Raises:
+        RasterioIOError: If the output raster cannot be written.
+
     Returns:
         None
     """
-    with rasterio.open(input_raster) as src:
-        transform, width, height = calculate_default_transform(
-            src.crs, dst_crs, src.width, src.height, *src.bounds)
-        kwargs = src.meta.copy()
-        kwargs.update({
-            'crs': dst_crs,
-            'transform': transform,
-            'width': width,
-            'height': height})
-
-        with rasterio.open(output_raster, "w", **kwargs) as dst:
-            for i in range(1, src.count + 1):
-                reproject(
-                    source=rasterio.band(src, i),
-                    destination=rasterio.band(dst, i),
-                    src_transform=src.transform,
-                    src_crs=src.crs,
-                    dst_transform=transform,
-                    dst_crs=dst_crs,
-                    resampling=Resampling.nearest)
+    # WarpedVRT reprojects on read; the COG driver pulls it block by block,
+    # so the full destination raster is never held in memory. The Env lets
+    # every GDAL stage use all cores and gives the block cache 512 MB.
+    with rasterio.Env(GDAL_NUM_THREADS="ALL_CPUS", GDAL_CACHEMAX=512), \
+            reproject_raster_layer_vrt(dst_crs, input_raster) as vrt:
+        try:
+            rasterio.shutil.copy(
+                vrt,
+                output_raster,
+                driver="COG",
+                COMPRESS="ZSTD",
+                OVERVIEW_RESAMPLING="NEAREST",
+                NUM_THREADS="ALL_CPUS")
+        except CPLE_BaseError as e:
+            # shutil.copy surfaces raw GDAL errors; keep the RasterioIOError
+            # that rasterio.open raised for unwritable outputs
+            raise rasterio.errors.RasterioIOError(str(e)) from e
+
+def _project_geometries(geoms: np.ndarray, transformer: Transformer) -> np.ndarray:
+    """
+    Project an array of shapely geometries with a single bulk PROJ call.
+
+    All vertex coordinates are handed to the transformer at once instead of
+    one geometry at a time. 2D and 3D geometries are projected separately so
+    Z values are preserved.
+    """
+    def project_coords(coords: np.ndarray) -> np.ndarray:
+        return np.column_stack(transformer.transform(*coords.T))
+
+    projected = geoms.copy()
+    has_z = shapely.has_z(geoms)
+    for include_z, subset in ((False, ~has_z), (True, has_z)):
+        if subset.any():
+            projected[subset] = shapely.transform(geoms[subset], project_coords, include_z=include_z)
+    return projected
 
 def reproject_vector_layer(dst_crs: str, input_vector: Path, output_vector: Path) -> None:
     """
@@ -155,12 +434,21 @@ def reproject_vector_layer(dst_crs: str, input_vector: Path, output_vector: Path
         input_vector (Path): Path to the input vector file.
         output_vector (Path): Path where the reprojected vector will be saved.
 
+    Raises:
+        ValueError: If the input vector has no CRS.
+
     Returns:
         None
     """
-    gdf = gpd.read_file(input_vector)
-    gdf = gdf.to_crs(dst_crs)
-    gdf.to_file(output_vector, driver="GPKG")
+    gdf = gpd.read_file(input_vector, engine="pyogrio", use_arrow=_USE_ARROW)
+
+    if gdf.crs is None:
+        raise ValueError("Input vector has no CRS")
+
+    transformer = transformer_from_crs(gdf.crs, dst_crs)
+    projected = _project_geometries(gdf.geometry.to_numpy(), transformer)
+    gdf = gdf.set_geometry(gpd.GeoSeries(projected, index=gdf.index, crs=dst_crs))
+    gdf.to_file(output_vector, driver="GPKG", engine="pyogrio")
 
 def raster_to_vector(input_raster_path: Path, output_vector_path: Path) -> None:
     """
@@ -180,17 +468,36 @@ def raster_to_vector(input_raster_path: Path, output_vector_path: Path) -> None:
         None
     """
     with rasterio.open(input_raster_path) as src:
-        features = []
-        for geom, value in shapes(src.read(1), transform=src.transform):
-            if value == 255:
-                features.append({
-                    "geometry": shape(geom), "value": value})
-
-        if not features:
+        band = src.read(1)
+        foreground = band == 255
+        if not foreground.any():
             raise ValueError("No foreground pixels (value=255) found in raster")
 
-        gdf = gpd.GeoDataFrame(features, crs=src.crs)
-        gdf.to_file(output_vector_path, driver="GPKG")
+        # Masking restricts polygonization to foreground components, so no
+        # background polygons are traced only to be discarded afterwards.
+        # GeoJSON rings are collected into flat coordinate/offset buffers so
+        # all polygons are built by shapely in one pass.
+        coords = []
+        ring_offsets = [0]
+        geom_offsets = [0]
+        for geom, _ in shapes(band, mask=foreground, transform=src.transform):
+            for ring in geom["coordinates"]:
+                coords.extend(ring)
+                ring_offsets.append(len(coords))
+            geom_offsets.append(len(ring_offsets) - 1)
+
+        polygons = shapely.from_ragged_array(
+            shapely.GeometryType.POLYGON,
+            np.array(coords, dtype=np.float64),
+            (np.array(ring_offsets), np.array(geom_offsets)))
+
+        gdf = gpd.GeoDataFrame(
+            {"value": np.full(len(polygons), 255.0)},
+            geometry=polygons,
+            crs=src.crs)
+        # Intermediate layer that is always read back in full: skip building
+        # the GeoPackage R-tree, which would otherwise dominate write time
+        gdf.to_file(output_vector_path, driver="GPKG", engine="pyogrio", layer_options={"SPATIAL_INDEX": "NO"})
 
 def add_id(gdf: gpd.GeoDataFrame, id_vector_path: Path) -> gpd.GeoDataFrame:
     """
@@ -203,11 +510,33 @@ def add_id(gdf: gpd.GeoDataFrame, id_vector_path: Path) -> gpd.GeoDataFrame:
     Returns:
         GeoDataFrame: GeoDataFrame with an added unique 'id' column.
     """
-    gdf = gdf.copy()
-    gdf['id'] = range(1, len(gdf)+1)
-    gdf.to_file(id_vector_path, driver="GPKG")
+    gdf = gdf.assign(id=np.arange(1, len(gdf) + 1, dtype=np.int64))
+    gdf.to_file(id_vector_path, driver="GPKG", engine="pyogrio")
     return gdf
 
+def _map_geometry_chunks(func, *arrays: np.ndarray, **kwargs) -> np.ndarray:
+    """
+    Apply a vectorized shapely function to geometry arrays in parallel chunks.
+
+    Shapely 2 releases the GIL inside its ufuncs, so splitting the arrays
+    into contiguous chunks and running them on threads scales across cores
+    without pickling geometries. Small inputs are processed in a single call.
+    All arrays are split at the same positions so element-wise pairs stay aligned.
+    """
+    n = len(arrays[0])
+    workers = min(os.cpu_count() or 1, n // _MIN_GEOMETRIES_PER_WORKER)
+    if workers <= 1:
+        return func(*arrays, **kwargs)
+
+    bounds = np.linspace(0, n, workers + 1, dtype=np.int64)
+    chunks = [
+        [array[start:stop] for array in arrays]
+        for start, stop in zip(bounds[:-1], bounds[1:])]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(lambda chunk: func(*chunk, **kwargs), chunks))
+    return np.concatenate(results)
+
 def buffer_vector(gdf: gpd.GeoDataFrame, distance: float) -> gpd.GeoDataFrame:
     """
     Create buffer geometries around input vector features.
@@ -235,14 +564,16 @@ def buffer_vector(gdf: gpd.GeoDataFrame, distance: float) -> gpd.GeoDataFrame:
     if gdf.empty:
         return gdf.copy()
 
-    if not gdf.geometry.notnull().all():
+    geoms = gdf.geometry.to_numpy()
+
+    if shapely.is_missing(geoms).any():
         raise ValueError("Input contains null geometries")
 
-    if not gdf.geometry.is_valid.all():
+    if not shapely.is_valid(geoms).all():
         raise ValueError("Input contains invalid geometries")
 
     buffered = gdf.copy()
-    buffered.geometry = buffered.geometry.buffer(distance)
+    buffered.geometry = gpd.GeoSeries(_map_geometry_chunks(shapely.buffer, geoms, distance=distance), index=gdf.index, crs=gdf.crs)
     return buffered
 
 def clipping_vectors(input_vector: gpd.GeoDataFrame, mask_vector: gpd.GeoDataFrame, output_vector_path: Path) -> None:
@@ -265,20 +596,42 @@ def clipping_vectors(input_vector: gpd.GeoDataFrame, mask_vector: gpd.GeoDataFra
     if input_vector.crs != mask_vector.crs:
         raise ValueError("Input and mask CRS must match")
 
-    if not input_vector.geometry.notnull().all():
+    input_geoms = input_vector.geometry.to_numpy()
+    mask_geoms = mask_vector.geometry.to_numpy()
+
+    if shapely.is_missing(input_geoms).any():
         raise ValueError("Input contains null geometries")
 
-    if not mask_vector.geometry.notnull().all():
+    if shapely.is_missing(mask_geoms).any():
         raise ValueError("Mask contains null geometries")
 
-    if not input_vector.geometry.is_valid.all():
+    if not shapely.is_valid(input_geoms).all():
         raise ValueError("Input contains invalid geometries")
 
-    if not mask_vector.geometry.is_valid.all():
+    if not shapely.is_valid(mask_geoms).all():
         raise ValueError("Mask contains invalid geometries")
 
-    clipped = gpd.clip(input_vector, mask_vector, keep_geom_type=False, sort=False)
-    clipped.to_file(output_vector_path, driver="GPKG")
+    if len(mask_geoms) <= _MAX_DISSOLVED_MASK_PARTS:
+        # Small mask: dissolve it once and prepare it, so the intersects
+        # filter over all inputs reuses GEOS's internal index of the mask.
+        mask_union = shapely.union_all(mask_geoms)
+        shapely.prepare(mask_union)
+        hits = np.flatnonzero(shapely.intersects(input_geoms, mask_union))
+        mask_unions = np.full(hits.size, mask_union, dtype=object)
+    else:
+        # Large mask: spatial index prefilter, so each input feature is
+        # clipped against the union of just the mask polygons it intersects
+        # instead of the dissolved mask as a whole.
+        input_idx, mask_idx = shapely.STRtree(mask_geoms).query(input_geoms, predicate="intersects")
+        hits, starts = np.unique(input_idx, return_index=True)
+        mask_groups = np.split(mask_geoms[mask_idx], starts[1:]) if hits.size else []
+        mask_unions = np.array([shapely.union_all(group) for group in mask_groups], dtype=object)
+
+    clipped_geoms = _map_geometry_chunks(shapely.intersection, input_geoms[hits], mask_unions)
+
+    clipped = input_vector.iloc[hits].copy()
+    clipped.geometry = gpd.GeoSeries(clipped_geoms, index=clipped.index, crs=input_vector.crs)
+    clipped.to_file(output_vector_path, driver="GPKG", engine="pyogrio")
 
 def calculate_area(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     """
@@ -366,13 +719,18 @@ def calculate_greendex(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     gdf['greendex'] = gdf['greendex'].fillna(0)
     gdf['greendex'] = gdf['greendex'].round(4)
 
-    if gdf['length'].max() == gdf['length'].min():
-        length_norm = 1.0
-    else:
-        length_norm = (gdf['length'] - gdf['length'].min()) / (gdf['length'].max() - gdf['length'].min())
-    
-    green_norm = 1 - gdf['greendex']
-    gdf['weight'] = length_norm * green_norm
-    gdf['weight'] = gdf['weight'].round(4)
+    length_min = gdf['length'].min()
+    length_range = gdf['length'].max() - length_min
+
+    # Weight is built in place in a single float buffer instead of allocating
+    # a new Series for every intermediate (normalize, invert, multiply).
+    weight = 1.0 - gdf['greendex'].to_numpy(dtype=np.float64)
+    if length_range != 0:
+        length_norm = gdf['length'].to_numpy(dtype=np.float64, copy=True)
+        np.subtract(length_norm, length_min, out=length_norm)
+        np.divide(length_norm, length_range, out=length_norm)
+        np.multiply(weight, length_norm, out=weight)
+
+    gdf['weight'] = np.round(weight, 4)
 
     return gdf
\ No newline at end of file
@@ -9,18 +9,29 @@ from dataclasses import dataclass
 from enum import Enum
 
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s"
-)
 logger = logging.getLogger(__name__)
 
+# Finest ground resolution (meters per pixel) available from NAIP imagery
+MIN_RESOLUTION = 0.6
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """
+    Configure root logging for pipeline scripts.
+
+    Called explicitly from each script entry point so that importing the
+    utilities does not install handlers on the root logger as a side effect.
+    """
+    logging.basicConfig(
+        level=level,
+        format="%(asctime)s [%(levelname)s] %(message)s"
+    )
+
 class RoutingPreference(Enum):
     """Available routing optimization modes."""
     SHORTEST = "length"
     GREENEST = "weight"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserInput:
     """Container for all user-provided parameters controlling the pipeline."""
     aoi_name: str
@@ -40,6 +51,11 @@ class UserInput:
         if any(field is None for field in critical_fields):
             raise ValueError("Missing required user input fields")
 
+        # Coerce coordinates and resolution to float once at construction
+        # (frozen dataclass, so fields are set through object.__setattr__)
+        for name in ("sw_lat", "sw_lon", "ne_lat", "ne_lon", "resolution"):
+            object.__setattr__(self, name, float(getattr(self, name)))
+
         # Degenerate bbox (SW == NE)
         if self.sw_lat == self.ne_lat or self.sw_lon == self.ne_lon:
             raise ValueError("Degenerate bounding box: SW and NE cannot be equal")
@@ -55,7 +71,7 @@ class UserInput:
             raise ValueError("Longitude must be between -180 and 180")
 
         # Resolution must not be smaller than 0.6
-        if self.resolution < 0.6:
+        if self.resolution < MIN_RESOLUTION:
             raise ValueError("Finest possible resolution is 0.6m for NAIP satellite imagery") 
 
 def user_input() -> UserInput:
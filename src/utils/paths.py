@@ -1,9 +1,15 @@
 import logging
+import os
+from functools import lru_cache
 from pathlib import Path
 
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import; set URBAN_GREEN_DATA_ROOT to relocate the data folder
+DATA_ROOT = Path(os.environ.get("URBAN_GREEN_DATA_ROOT", Path.home() / "urban-green-routing" / "data"))
+
+@lru_cache(maxsize=None)
 def get_data_folder(subfolder: str = "raw") -> Path:
     """
     Returns the absolute path to a project data subfolder, creating it if necessary.
@@ -12,14 +18,16 @@ def get_data_folder(subfolder: str = "raw") -> Path:
     has a reliable, consistent folder to work with, without
     changing the global working directory.
 
+    The result is cached per subfolder, so the folder is created and logged
+    only on the first call.
+
     Args:
         subfolder (str): Name of the subfolder (e.g., "raw", "processed").
 
     Returns:
         Path: Absolute Path object pointing to the requested folder.
     """
-    project_root = Path.home() / "urban-green-routing" / "data"
-    folder = project_root / subfolder
+    folder = DATA_ROOT / subfolder
     folder.mkdir(parents=True, exist_ok=True)
 
     logger.info("Data folder path: %s", folder)
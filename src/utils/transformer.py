@@ -0,0 +1,27 @@
+"""
+Shared pyproj Transformer cache.
+
+Constructing a Transformer (PROJ context, database lookup, pipeline
+selection) costs orders of magnitude more than running it on a few points.
+Every module that needs a coordinate transformation takes it from here so
+all callers share one pool of transformers per CRS pair.
+"""
+
+from functools import lru_cache
+from pyproj import CRS, Transformer
+
+
+@lru_cache(maxsize=128)
+def transformer_from_crs(src_crs: str | int | CRS, dst_crs: str | int | CRS, always_xy: bool = True) -> Transformer:
+    """
+    Return a cached pyproj Transformer for a CRS pair.
+
+    Parameters:
+        src_crs (str | int | CRS): Source CRS (e.g. 'EPSG:4326', 4326 or a pyproj CRS).
+        dst_crs (str | int | CRS): Target CRS (e.g. 'EPSG:3857', 3857 or a pyproj CRS).
+        always_xy (bool): Use (lon, lat) / (x, y) axis order regardless of CRS definition.
+
+    Returns:
+        Transformer: Transformer shared by all callers using the same arguments.
+    """
+    return Transformer.from_crs(src_crs, dst_crs, always_xy=always_xy)
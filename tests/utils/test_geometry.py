@@ -1,3 +1,4 @@
+import dataclasses
 import pytest
 from unittest.mock import patch
 import geopandas as gpd
@@ -6,14 +7,21 @@ from shapely.geometry import Polygon
 from pyproj import CRS
 import numpy as np
 import rasterio
+from rasterio._err import CPLE_OpenFailedError
+from rasterio.io import MemoryFile
 from rasterio.transform import from_origin
 from utils.inputs import UserInput, RoutingPreference
 from utils.geometry import (
     BoundingBoxMercator,
+    BoundingBoxMercatorArray,
     bounding_box_mercator,
+    bounding_box_mercator_batch,
+    batch_project,
     tile_calculator,
+    tile_calculator_batch,
     bounding_box_osm,
     reproject_raster_layer,
+    reproject_raster_layer_vrt,
     reproject_vector_layer,
     raster_to_vector,
     add_id,
@@ -36,24 +44,51 @@ Test categories:
 - Edge cases: extreme lat/lon (poles, dateline)
 """
 
-def test_bounding_box_mercator_normal_coordinates():
+_BASE_INPUT = UserInput(
+    aoi_name = "test_aoi",
+    sw_lat = 0,
+    sw_lon = 0,
+    ne_lat = 1,
+    ne_lon = 1,
+    resolution = 1,
+    routing_source = 1,
+    routing_target = 2,
+    routing_weight = RoutingPreference.SHORTEST)
+
+@pytest.fixture(scope="module", autouse=True)
+def _gdal_env():
+    """
+    Run this module's tests in one GDAL environment that skips sidecar-file directory scans on open.
     """
-    Typical valid coordinates (SW < NE)
+    with rasterio.Env(GDAL_DISABLE_READDIR_ON_OPEN="EMPTY_DIR"):
+        yield
+
+@pytest.fixture(scope="module")
+def user_input():
+    return _BASE_INPUT
+
+@pytest.mark.parametrize(
+    "sw_lat, sw_lon, ne_lat, ne_lon",
+        [
+            (0,0,1,1),
+            (-85,-179,85,179)
+        ]
+)
+def test_bounding_box_mercator_coordinates(sw_lat, sw_lon, ne_lat, ne_lon):
+    """
+    Typical (SW < NE) and extreme lat/lon values
     Verify:
     - Returned object is BoundingBoxMercator
     - xmin < xmax, ymin < ymax
-    - Rough numeric check of expected transformed coordinates
-    """
-    user_input = UserInput(
-        aoi_name = "test_aoi",
-        sw_lat = 0,
-        sw_lon = 0,
-        ne_lat = 1,
-        ne_lon = 1,
-        resolution = 1,
-        routing_source = 1,
-        routing_target = 2,
-        routing_weight = RoutingPreference.SHORTEST)
+    - No infinite values
+    - Rough numeric check of expected transformed coordinates (typical case)
+    """
+    user_input = dataclasses.replace(
+        _BASE_INPUT,
+        sw_lat = sw_lat,
+        sw_lon = sw_lon,
+        ne_lat = ne_lat,
+        ne_lon = ne_lon)
 
     bbox_mercator = bounding_box_mercator(user_input)
 
@@ -62,39 +97,113 @@ def test_bounding_box_mercator_normal_coordinates():
     assert bbox_mercator.xmin < bbox_mercator.xmax
     assert bbox_mercator.ymin < bbox_mercator.ymax
 
-    assert bbox_mercator.xmin == 0
-    assert bbox_mercator.ymin == 0
-    assert 111000 < bbox_mercator.xmax < 112000
-    assert 111000 < bbox_mercator.ymax < 112000
+    for val in [bbox_mercator.xmin, bbox_mercator.ymin, bbox_mercator.xmax, bbox_mercator.ymax]:
+        assert val != float("inf")
+
+    if (sw_lat, sw_lon, ne_lat, ne_lon) == (0,0,1,1):
+        assert bbox_mercator.xmin == 0
+        assert bbox_mercator.ymin == 0
+        assert 111000 < bbox_mercator.xmax < 112000
+        assert 111000 < bbox_mercator.ymax < 112000
 
-def test_bounding_box_mercator_extreme_coordinates():
+def test_bounding_box_mercator_clips_poles():
     """
-    Extreme lat/lon values
+    Latitudes beyond the Web Mercator limit (±85.05112878)
     Verify:
-    - Returned object is BoundingBoxMercator
-    - xmin < xmax, ymin < ymax
-    - No infinite values
+    - Poles are clipped instead of projecting to infinity
+    - Clipped y equals the Web Mercator half-extent (~20037508 m)
     """
-    user_input = UserInput(
-        aoi_name = "test_aoi",
-        sw_lat = -85,
-        sw_lon = -179,
-        ne_lat = 85,
-        ne_lon = 179,
-        resolution = 1,
-        routing_source = 1,
-        routing_target = 2,
-        routing_weight = RoutingPreference.SHORTEST)
+    user_input = dataclasses.replace(
+        _BASE_INPUT,
+        sw_lat = -90,
+        sw_lon = -180,
+        ne_lat = 90,
+        ne_lon = 180)
 
     bbox_mercator = bounding_box_mercator(user_input)
 
-    assert isinstance(bbox_mercator, BoundingBoxMercator)
+    assert bbox_mercator.ymin == pytest.approx(-20037508.34, abs=1)
+    assert bbox_mercator.ymax == pytest.approx(20037508.34, abs=1)
+    assert bbox_mercator.xmax == pytest.approx(20037508.34, abs=1)
 
-    assert bbox_mercator.xmin < bbox_mercator.xmax
-    assert bbox_mercator.ymin < bbox_mercator.ymax
+def test_bounding_box_mercator_batch_matches_bounding_box_mercator(user_input):
+    """
+    Convert several AOIs to Web Mercator in one call.
 
-    for val in [bbox_mercator.xmin, bbox_mercator.ymin, bbox_mercator.xmax, bbox_mercator.ymax]:
-        assert val != float("inf")
+    Verify:
+    - Returned object is BoundingBoxMercatorArray with one entry per AOI
+    - Each entry matches the single-AOI conversion
+    """
+    user_inputs = [
+        user_input,
+        dataclasses.replace(_BASE_INPUT, sw_lat = -85, sw_lon = -179, ne_lat = 85, ne_lon = 179),
+        dataclasses.replace(_BASE_INPUT, sw_lat = -90, sw_lon = -180, ne_lat = 90, ne_lon = 180)]
+
+    bboxes_mercator = bounding_box_mercator_batch(user_inputs)
+
+    assert isinstance(bboxes_mercator, BoundingBoxMercatorArray)
+    assert len(bboxes_mercator) == 3
+
+    for i, ui in enumerate(user_inputs):
+        expected = bounding_box_mercator(ui)
+        assert bboxes_mercator.xmin[i] == pytest.approx(expected.xmin)
+        assert bboxes_mercator.ymin[i] == pytest.approx(expected.ymin)
+        assert bboxes_mercator.xmax[i] == pytest.approx(expected.xmax)
+        assert bboxes_mercator.ymax[i] == pytest.approx(expected.ymax)
+
+def test_batch_project_matches_bounding_box_mercator(user_input):
+    """
+    Project several coordinate pairs from WGS84 to Web Mercator in one call.
+
+    Verify:
+    - Output arrays keep the input shape
+    - Projected values match the per-corner bounding box conversion
+    """
+    bbox_mercator = bounding_box_mercator(user_input)
+
+    xs, ys = batch_project(np.array([0.0, 1.0]), np.array([0.0, 1.0]))
+
+    assert xs.shape == (2,)
+    assert ys.shape == (2,)
+    assert xs == pytest.approx([bbox_mercator.xmin, bbox_mercator.xmax])
+    assert ys == pytest.approx([bbox_mercator.ymin, bbox_mercator.ymax])
+
+def test_batch_project_packages_transformer_output():
+    """
+    Project coordinates with PROJ mocked out, testing only the wrapper logic.
+
+    Verify:
+    - The transformer is requested for the given CRS pair
+    - Inputs are passed on as float64 arrays
+    - Transformer output is returned as NumPy arrays
+    """
+    with patch("utils.geometry.transformer_from_crs") as mock_factory:
+        mock_factory.return_value.transform.return_value = ([111319.49], [111325.14])
+
+        xs, ys = batch_project([1], [1])
+
+    mock_factory.assert_called_once_with("EPSG:4326", "EPSG:3857")
+    lons, lats = mock_factory.return_value.transform.call_args.args
+    assert lons.dtype == np.float64
+    assert lats.dtype == np.float64
+
+    assert isinstance(xs, np.ndarray)
+    assert isinstance(ys, np.ndarray)
+    assert xs[0] == pytest.approx(111319.49)
+    assert ys[0] == pytest.approx(111325.14)
+
+def test_batch_project_shape_mismatch():
+    """
+    Attempt to project coordinate arrays of different lengths.
+
+    Raises:
+        ValueError: If lons and lats do not have the same shape.
+    """
+    with pytest.raises(ValueError) as exc_info:
+        batch_project(np.zeros(3), np.zeros(2))
+
+    expected_msg = "Longitude and latitude arrays must have the same shape"
+    assert str(exc_info.value) == expected_msg
 
 def test_tile_calculator_normal_bbox():
     """
@@ -120,6 +229,82 @@ def test_tile_calculator_normal_bbox():
     assert height == 10
 
 
+def test_tile_calculator_block_align():
+    """
+    Tile dimensions rounded up to a block size.
+
+    Verify:
+    - Width and height are rounded up to the next multiple of block_align
+    - Sizes already on a block boundary are left unchanged
+    - An aligned size above 2500 pixels is rejected
+    """
+    bbox_mercator = BoundingBoxMercator(xmin = 0, ymin = 0, xmax = 480, ymax = 512)
+
+    assert tile_calculator(bbox_mercator, 1, block_align=256) == (512, 512)
+
+    bbox_mercator = BoundingBoxMercator(xmin = 0, ymin = 0, xmax = 2400, ymax = 10)
+
+    with pytest.raises(ValueError) as exc_info:
+        tile_calculator(bbox_mercator, 1, block_align=256)
+
+    expected_msg = "Tile size too large: maximum allowed is 2500x2500 pixels. Width: 2560, height: 256"
+    assert str(exc_info.value) == expected_msg
+
+def test_tile_calculator_block_align_below_min_resolution():
+    """
+    Block alignment that would make the effective pixel size finer than NAIP provides.
+
+    Raises:
+        ValueError: If extent / aligned size drops below the 0.6m resolution floor.
+    """
+    bbox_mercator = BoundingBoxMercator(xmin = 0, ymin = 0, xmax = 10, ymax = 10)
+
+    with pytest.raises(ValueError) as exc_info:
+        tile_calculator(bbox_mercator, 1, block_align=256)
+
+    expected_msg = "Block-aligned tile is finer than the 0.6m NAIP resolution. Width: 256, height: 256, effective resolution: 0.039m"
+    assert str(exc_info.value) == expected_msg
+
+def test_tile_calculator_negative_block_align():
+    """
+    Negative block size passed as block_align.
+
+    Raises:
+        ValueError: If block_align is negative instead of silently rounding down.
+    """
+    bbox_mercator = BoundingBoxMercator(xmin = 0, ymin = 0, xmax = 900, ymax = 900)
+
+    with pytest.raises(ValueError) as exc_info:
+        tile_calculator(bbox_mercator, 1, block_align=-256)
+
+    expected_msg = "block_align must be >= 0. Got: -256"
+    assert str(exc_info.value) == expected_msg
+
+def test_tile_calculator_batch_block_align():
+    """
+    Block-aligned tile sizes for many boxes at once.
+
+    Verify:
+    - Aligned sizes match the single-box tile_calculator
+    - A box whose aligned size drops below the 0.6m resolution floor is rejected with its index
+    """
+    boxes = [
+        BoundingBoxMercator(xmin = 0, ymin = 0, xmax = 480, ymax = 512),
+        BoundingBoxMercator(xmin = 0, ymin = 0, xmax = 1000, ymax = 700)]
+
+    widths, heights = tile_calculator_batch(BoundingBoxMercatorArray.from_boxes(boxes), 1, block_align=256)
+
+    for i, box in enumerate(boxes):
+        assert (widths[i], heights[i]) == tile_calculator(box, 1, block_align=256)
+
+    boxes.append(BoundingBoxMercator(xmin = 0, ymin = 0, xmax = 10, ymax = 10))
+
+    with pytest.raises(ValueError) as exc_info:
+        tile_calculator_batch(BoundingBoxMercatorArray.from_boxes(boxes), 1, block_align=256)
+
+    expected_msg = "Block-aligned tile is finer than the 0.6m NAIP resolution. Width: 256, height: 256, effective resolution: 0.039m (box 2)"
+    assert str(exc_info.value) == expected_msg
+
 @pytest.mark.parametrize(
     "xmax, ymax, expected_msg",
         [
@@ -150,56 +335,85 @@ def test_tile_calculator_invalid_bbox_size(xmax, ymax, expected_msg):
 
     assert str(exc_info.value) == expected_msg
 
-def test_bounding_box_osm_normal_coordinates():
+def test_tile_calculator_batch_matches_tile_calculator():
     """
-    Normal bounding box coordinates converted to an OSM-compatible tuple.
+    Compute tile sizes for several bounding boxes in one call.
 
     Verify:
-    - The returned object is a tuple
-    - All values are floats
-    - The ordering is correct: (xmin, ymin, xmax, ymax)
-    - Typical SW < NE coordinates are handled correctly
-    """
-    user_input = UserInput(
-        aoi_name = "test_aoi",
-        sw_lat = 0,
-        sw_lon = 0,
-        ne_lat = 1,
-        ne_lon = 1,
-        resolution = 1,
-        routing_source = 1,
-        routing_target = 2,
-        routing_weight = RoutingPreference.SHORTEST)
+    - One width and height is returned per bounding box
+    - Each width and height matches the single-box tile_calculator result
+    """
+    boxes = [
+        BoundingBoxMercator(xmin = 0, ymin = 0, xmax = 10, ymax = 10),
+        BoundingBoxMercator(xmin = 100, ymin = 50, xmax = 160.4, ymax = 70.6),
+        BoundingBoxMercator(xmin = -5, ymin = -5, xmax = 2495, ymax = 5)]
+    resolution = 1
 
-    bbox_osm = bounding_box_osm(user_input)
+    widths, heights = tile_calculator_batch(BoundingBoxMercatorArray.from_boxes(boxes), resolution)
 
-    assert isinstance(bbox_osm, tuple)
+    assert len(widths) == len(boxes)
+    assert len(heights) == len(boxes)
 
-    for val in bbox_osm:
-        assert isinstance(val, float)
-    
-    assert bbox_osm == (user_input.sw_lon, user_input.sw_lat, user_input.ne_lon, user_input.ne_lat)
+    for box, width, height in zip(boxes, widths, heights):
+        assert (width, height) == tile_calculator(box, resolution)
+
+def test_bounding_box_mercator_array_identity_semantics():
+    """
+    Compare and hash BoundingBoxMercatorArray instances holding several boxes.
+
+    Verify:
+    - Instances are hashable
+    - Equality is by identity and does not evaluate ndarray truth values
+    """
+    boxes = [BoundingBoxMercator(0, 0, 10, 10), BoundingBoxMercator(0, 0, 20, 20)]
+    first = BoundingBoxMercatorArray.from_boxes(boxes)
+    second = BoundingBoxMercatorArray.from_boxes(boxes)
+
+    assert hash(first) == hash(first)
+    assert first == first
+    assert first != second
 
-def test_bounding_box_osm_extreme_coordinates():
+def test_tile_calculator_batch_invalid_bbox_size():
     """
-    Extreme bounding box coordinates converted to an OSM-compatible tuple.
+    Invalid bounding box size within a batch of otherwise valid boxes.
+
+    Verify:
+    - A ValueError is raised naming the first box with a dimension below 1 pixel
+    """
+    boxes = [
+        BoundingBoxMercator(xmin = 0, ymin = 0, xmax = 10, ymax = 10),
+        BoundingBoxMercator(xmin = 0, ymin = 0, xmax = 0.1, ymax = 0.1)]
+
+    with pytest.raises(ValueError) as exc_info:
+        tile_calculator_batch(BoundingBoxMercatorArray.from_boxes(boxes), 1)
+
+    expected_msg = "Width and height (pixel count) must be >= 1. Width: 0, height: 0 (box 1)"
+    assert str(exc_info.value) == expected_msg
+
+@pytest.mark.parametrize(
+    "sw_lat, sw_lon, ne_lat, ne_lon",
+        [
+            (0,0,1,1),
+            (-85,-179,85,179)
+        ]
+)
+def test_bounding_box_osm_coordinates(sw_lat, sw_lon, ne_lat, ne_lon):
+    """
+    Typical and extreme bounding box coordinates converted to an OSM-compatible tuple.
 
     Verify:
     - The returned object is a tuple
-    - xmin < xmax, ymin < ymax
+    - All values are floats
+    - The ordering is correct: (xmin, ymin, xmax, ymax), so xmin < xmax, ymin < ymax
     - No value is infinite
     - Works with coordinates near valid extremes (-85 to 85 latitude, -179 to 179 longitude)
     """
-    user_input = UserInput(
-        aoi_name = "test_aoi",
-        sw_lat = -85,
-        sw_lon = -179,
-        ne_lat = 85,
-        ne_lon = 179,
-        resolution = 1,
-        routing_source = 1,
-        routing_target = 2,
-        routing_weight = RoutingPreference.SHORTEST)
+    user_input = dataclasses.replace(
+        _BASE_INPUT,
+        sw_lat = sw_lat,
+        sw_lon = sw_lon,
+        ne_lat = ne_lat,
+        ne_lon = ne_lon)
 
     bbox_osm = bounding_box_osm(user_input)
 
@@ -212,33 +426,38 @@ def test_bounding_box_osm_extreme_coordinates():
         assert val != float("inf")
         assert isinstance(val, float)
 
-@pytest.fixture
-def simple_raster(tmp_path):
+    assert bbox_osm == (user_input.sw_lon, user_input.sw_lat, user_input.ne_lon, user_input.ne_lat)
+
+@pytest.fixture(scope="session")
+def simple_raster():
     """
     Create a simple 1-band 10x10 raster with EPSG:4326 CRS for testing.
+    Written tiled and deflate-compressed like the COG inputs used in production.
 
-    Returns:
-        Path: Path to the created raster file.
+    Yields:
+        str: /vsimem/ path of the in-memory raster.
     """
-    raster_path = tmp_path / "input.tif"
-
-    data = np.ones((1, 10, 10), dtype=np.uint8)
+    data = np.broadcast_to(np.uint8(1), (1, 10, 10))
     transform = from_origin(0, 10, 1, 1)  # top left corner is at: x=0,y=10, pixel size=1
 
-    with rasterio.open(
-        raster_path,
-        "w",
-        driver="GTiff",
-        height=10,
-        width=10,
-        count=1,
-        dtype=data.dtype,
-        crs="EPSG:4326",
-        transform=transform,
-    ) as dst:
-        dst.write(data)
-
-    return raster_path
+    with MemoryFile() as memfile:
+        with memfile.open(
+            driver="GTiff",
+            height=10,
+            width=10,
+            count=1,
+            dtype=data.dtype,
+            crs="EPSG:4326",
+            transform=transform,
+            tiled=True,
+            blockxsize=256,
+            blockysize=256,
+            compress="deflate",
+            predictor=2,
+        ) as dst:
+            dst.write(data)
+
+        yield memfile.name
 
 def test_reproject_raster_layer_creates_output(simple_raster, tmp_path):
     """
@@ -263,6 +482,24 @@ def test_reproject_raster_layer_creates_output(simple_raster, tmp_path):
         assert dst.height > 0
         assert dst.count == 1 #1band
 
+def test_reproject_raster_layer_vrt_matches_file_output(simple_raster, tmp_path):
+    """
+    Reproject a raster on the fly without writing it to disk.
+
+    Verify:
+    - The virtual dataset has the target CRS
+    - Its pixels match the raster written by reproject_raster_layer
+    """
+    dst_crs = 'EPSG:5070'
+    output_raster = tmp_path / "output.tif"
+
+    reproject_raster_layer(dst_crs, simple_raster, output_raster)
+
+    with reproject_raster_layer_vrt(dst_crs, simple_raster) as vrt, rasterio.open(output_raster) as dst:
+        assert vrt.crs.to_string() == dst_crs
+        assert vrt.shape == dst.shape
+        assert np.array_equal(vrt.read(1), dst.read(1))
+
 def test_reproject_raster_layer_missing_input(tmp_path):
     """
     Verify that reprojecting a raster with a missing input path raises a RasterioIOError.
@@ -273,6 +510,35 @@ def test_reproject_raster_layer_missing_input(tmp_path):
     with pytest.raises(rasterio.errors.RasterioIOError):
         reproject_raster_layer('EPSG:5070', input_raster, output_raster)
 
+def test_reproject_raster_layer_epsg_int(simple_raster, tmp_path):
+    """
+    Reproject a raster with the target CRS given as an integer EPSG code.
+
+    Verify:
+    - The output raster has the CRS matching the EPSG code
+    """
+    output_raster = tmp_path / "output.tif"
+
+    reproject_raster_layer(5070, simple_raster, output_raster)
+
+    with rasterio.open(output_raster) as dst:
+        assert dst.crs.to_epsg() == 5070
+
+def test_reproject_raster_layer_crs_object(simple_raster, tmp_path):
+    """
+    Reproject a raster with the target CRS given as a rasterio CRS object.
+
+    Verify:
+    - The CRS object is accepted as-is
+    - The output raster has the target CRS
+    """
+    output_raster = tmp_path / "output.tif"
+
+    reproject_raster_layer(rasterio.crs.CRS.from_epsg(5070), simple_raster, output_raster)
+
+    with rasterio.open(output_raster) as dst:
+        assert dst.crs.to_epsg() == 5070
+
 def test_reproject_raster_layer_invalid_crs(simple_raster, tmp_path):
     """
     Verify that reprojecting a raster with an invalid CRS string
@@ -289,11 +555,20 @@ def test_reproject_raster_layer_permission_denied(simple_raster, tmp_path):
     """
     output_raster = tmp_path / "no_write"
 
-    with patch("rasterio.open", side_effect=rasterio.errors.RasterioIOError("Permission denied")):
+    with patch("rasterio.shutil.copy", side_effect=CPLE_OpenFailedError(4, 4, "Permission denied")):
         with pytest.raises(rasterio.errors.RasterioIOError):
             reproject_raster_layer('EPSG:5070', simple_raster, output_raster)
 
-@pytest.fixture
+def test_reproject_raster_layer_missing_output_directory(simple_raster, tmp_path):
+    """
+    Verify that writing the output into a directory that does not exist raises a RasterioIOError.
+    """
+    output_raster = tmp_path / "missing" / "output.tif"
+
+    with pytest.raises(rasterio.errors.RasterioIOError):
+        reproject_raster_layer('EPSG:5070', simple_raster, output_raster)
+
+@pytest.fixture(scope="module")
 def simple_gdf():
     gdf = gpd.GeoDataFrame({
         "geometry": [Polygon([(0,0),(1,0),(1,1),(0,1)])]},
@@ -301,7 +576,7 @@ def simple_gdf():
         crs="EPSG:4326")
     return gdf
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def empty_gdf():
     gdf = gpd.GeoDataFrame({
         "geometry": []},
@@ -353,6 +628,25 @@ def test_reproject_vector_layer_allows_empty_vector(empty_gdf, tmp_path):
     assert len(out_gdf) == 0
     assert out_gdf.crs == CRS.from_user_input(dst_crs)
 
+def test_reproject_vector_layer_missing_crs(tmp_path):
+    """
+    Attempt to reproject a vector file that has no CRS defined.
+
+    Raises:
+        ValueError: If the input vector has no CRS.
+    """
+    input_vector = tmp_path / "input.gpkg"
+    output_vector = tmp_path / "output.gpkg"
+
+    gdf = gpd.GeoDataFrame({"geometry": [Polygon([(0,0),(1,0),(1,1),(0,1)])]}, geometry="geometry")
+    gdf.to_file(input_vector, driver="GPKG")
+
+    with pytest.raises(ValueError) as exc_info:
+        reproject_vector_layer('EPSG:5070', input_vector, output_vector)
+
+    expected_msg = "Input vector has no CRS"
+    assert str(exc_info.value) == expected_msg
+
 def test_reproject_vector_layer_missing_input(tmp_path):
     """
     Attempt to reproject a vector file from a path that does not exist.
@@ -383,16 +677,14 @@ def test_reproject_vector_layer_permission_denied(simple_gdf, tmp_path):
             reproject_vector_layer('EPSG:5070', input_vector, output_vector)
 
 
-@pytest.fixture
-def clustered_raster(tmp_path):
+@pytest.fixture(scope="session")
+def clustered_raster():
     """
     Create a 1-band 10x10 raster with two foreground clusters for testing.
 
-    Returns:
-        Path: Path to the created raster file.
+    Yields:
+        str: /vsimem/ path of the in-memory raster.
     """
-    raster_path = tmp_path / "clustered.tif"
-
     data = np.zeros((1, 10, 10), dtype=np.uint8)
 
     # Cluster 1 (top-left 3x3)
@@ -408,21 +700,20 @@ def clustered_raster(tmp_path):
         ysize=1,
     )
 
-    with rasterio.open(
-        raster_path,
-        "w",
-        driver="GTiff",
-        height=10,
-        width=10,
-        count=1,
-        dtype=data.dtype,
-        crs="EPSG:5070",
-        transform=transform,
-        nodata=0,
-    ) as dst:
-        dst.write(data)
-
-    return raster_path
+    with MemoryFile() as memfile:
+        with memfile.open(
+            driver="GTiff",
+            height=10,
+            width=10,
+            count=1,
+            dtype=data.dtype,
+            crs="EPSG:5070",
+            transform=transform,
+            nodata=0,
+        ) as dst:
+            dst.write(data)
+
+        yield memfile.name
 
 def test_raster_to_vector_creates_output(clustered_raster, tmp_path):
     """
@@ -446,37 +737,34 @@ def test_raster_to_vector_creates_output(clustered_raster, tmp_path):
     assert out_gdf.crs.to_string() == "EPSG:5070"
     assert all(out_gdf.geometry.is_valid)
 
-    areas = sorted(out_gdf.geometry.area)
+    areas = np.sort(out_gdf.geometry.area.to_numpy())
     assert areas[0] == pytest.approx(9.0)
     assert areas[1] == pytest.approx(9.0)
 
-@pytest.fixture
-def one_pixel_raster(tmp_path):
+@pytest.fixture(scope="session")
+def one_pixel_raster():
     """
     Create a 1-band 1x1 raster with a single foreground pixel for testing.
 
-    Returns:
-        Path: Path to the created raster file.
+    Yields:
+        str: /vsimem/ path of the in-memory raster.
     """
-    raster_path = tmp_path / "input.tif"
-
-    data = np.full((1, 1, 1), 255, dtype=np.uint8)
+    data = np.broadcast_to(np.uint8(255), (1, 1, 1))
     transform = from_origin(0, 1, 1, 1)  # top left corner is at: x=0,y=1, pixel size=1
 
-    with rasterio.open(
-        raster_path,
-        "w",
-        driver="GTiff",
-        height=1,
-        width=1,
-        count=1,
-        dtype=data.dtype,
-        crs="EPSG:5070",
-        transform=transform,
-    ) as dst:
-        dst.write(data)
-
-    return raster_path
+    with MemoryFile() as memfile:
+        with memfile.open(
+            driver="GTiff",
+            height=1,
+            width=1,
+            count=1,
+            dtype=data.dtype,
+            crs="EPSG:5070",
+            transform=transform,
+        ) as dst:
+            dst.write(data)
+
+        yield memfile.name
 
 def test_raster_to_vector_single_output(one_pixel_raster, tmp_path):
     """
@@ -544,7 +832,7 @@ def test_raster_to_vector_permission_denied(one_pixel_raster, tmp_path):
         with pytest.raises(PermissionError):
             raster_to_vector(one_pixel_raster, output_vector_path)
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def complex_gdf():
     gdf = gpd.GeoDataFrame({
         "geometry": [
@@ -714,7 +1002,7 @@ def test_buffer_vector_none_geometry():
     expected_msg = "Input contains null geometries"
     assert str(exc_info.value) == expected_msg
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mask_gdf():
     gdf = gpd.GeoDataFrame({
         "geometry": [Polygon([(0.5,0),(1.5,0),(1.5,1),(0.5,1)])]},
@@ -722,7 +1010,7 @@ def mask_gdf():
         crs="EPSG:4326")
     return gdf
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mask_gdf_epsg_5070():
     gdf = gpd.GeoDataFrame({
         "geometry": [Polygon([(0.5,0),(1.5,0),(1.5,1),(0.5,1)])]},
@@ -731,7 +1019,7 @@ def mask_gdf_epsg_5070():
     return gdf
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def invalid_gdf():
     gdf = gpd.GeoDataFrame({
         "geometry": [Polygon([(0,0),(1,1),(1,0),(0,1),(0,0)])]},
@@ -739,7 +1027,7 @@ def invalid_gdf():
         crs="EPSG:4326")
     return gdf
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def none_gdf():
     gdf = gpd.GeoDataFrame({
         "geometry": [None]},
@@ -768,6 +1056,32 @@ def test_clipping_vectors_creates_clip(simple_gdf, mask_gdf, tmp_path):
     assert all(out_gdf.geometry.is_valid)
     assert pytest.approx(out_gdf.area.iloc[0]) == simple_gdf.area.iloc[0] * 0.5
 
+def test_clipping_vectors_many_mask_polygons(simple_gdf, tmp_path):
+    """
+    Clip a simple input polygon using a mask made of many small polygons.
+
+    Verify:
+    - The output vector file is created
+    - One feature is returned for the single input polygon
+    - The clipped area equals the area of the mask cells inside the input
+    """
+    output_vector_path = tmp_path / "output.gpkg"
+
+    # 20x20 grid of 0.1x0.1 cells over (0,0)-(2,2); only the 100 cells
+    # inside the unit square overlap the input polygon
+    cells = [
+        Polygon([(x, y), (x + 0.1, y), (x + 0.1, y + 0.1), (x, y + 0.1)])
+        for x in np.arange(0, 2, 0.1) for y in np.arange(0, 2, 0.1)]
+    many_mask_gdf = gpd.GeoDataFrame({"geometry": cells}, geometry="geometry", crs="EPSG:4326")
+
+    clipping_vectors(simple_gdf, many_mask_gdf, output_vector_path)
+
+    assert output_vector_path.exists()
+
+    out_gdf = gpd.read_file(output_vector_path)
+    assert len(out_gdf) == 1
+    assert out_gdf.area.iloc[0] == pytest.approx(simple_gdf.area.iloc[0])
+
 def test_clipping_vectors_crs_mismatch(simple_gdf, mask_gdf_epsg_5070, tmp_path):
     """
     Attempt to clip vectors with mismatching coordinate reference systems.
@@ -931,7 +1245,7 @@ def test_calculate_area_invalid_input(invalid_gdf):
     assert str(exc_info.value) == expected_msg
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def empty_geometry_gdf():
     gdf = gpd.GeoDataFrame({
         "geometry": [Polygon()]},
@@ -965,6 +1279,9 @@ def test_join_by_attribute_creates_output(simple_gdf, mask_gdf):
     - Area values from the join GeoDataFrame are correctly attached.
     - No rows are lost in the left join.
     """
+    simple_gdf = simple_gdf.copy()
+    mask_gdf = mask_gdf.copy()
+
     simple_gdf['id'] = 1
     simple_gdf['area'] = 1
     mask_gdf['id'] = 1
@@ -992,6 +1309,9 @@ def test_join_by_attribute_non_matching_ids(simple_gdf, mask_gdf):
     - The joined 'area' column contains NaN values for non-matching IDs.
     - Original IDs are preserved in the output.
     """
+    simple_gdf = simple_gdf.copy()
+    mask_gdf = mask_gdf.copy()
+
     simple_gdf['id'] = 1
     simple_gdf['area'] = 1
     mask_gdf['id'] = 2
@@ -1013,6 +1333,9 @@ def test_join_by_attribute_missing_inputlayer_id(simple_gdf, mask_gdf):
     Raises:
         ValueError: If the input GeoDataFrame is missing the 'id' column.
     """
+    mask_gdf = mask_gdf.copy()
+    simple_gdf = simple_gdf.copy()
+
     mask_gdf['id'] = 1
     simple_gdf['area'] = 1
     mask_gdf['area'] = 1
@@ -1031,6 +1354,9 @@ def test_join_by_attribute_missing_joinlayer_id(simple_gdf, mask_gdf):
     Raises:
         ValueError: If the join GeoDataFrame is missing the 'id' column.
     """
+    simple_gdf = simple_gdf.copy()
+    mask_gdf = mask_gdf.copy()
+
     simple_gdf['id'] = 1
     simple_gdf['area'] = 1
     mask_gdf['area'] = 1
@@ -1051,6 +1377,8 @@ def test_calculate_greendex_creates_output(complex_gdf):
     - weight is calculated as normalized length multiplied by inverted greendex.
     - Row count of the output matches the input GeoDataFrame.
     """
+    complex_gdf = complex_gdf.copy()
+
     complex_gdf['area_x'] = [100,100,100]
     complex_gdf['area_y'] = [20,10,50]
     complex_gdf['length'] = [10, 20, 30]
@@ -1075,6 +1403,8 @@ def test_calculate_greendex_returns_zero_when_area_x_is_zero(simple_gdf):
     - greendex is set to 0 when area_x is 0 to avoid division by zero.
     - Function returns a valid GeoDataFrame.
     """
+    simple_gdf = simple_gdf.copy()
+
     simple_gdf['area_x'] = [0]
     simple_gdf['area_y'] = [1]
     simple_gdf['length'] = [1]
@@ -1091,6 +1421,8 @@ def test_calculate_greendex_is_capped(simple_gdf):
     - greendex does not exceed 1 even if area_y > area_x.
     - Function returns a valid GeoDataFrame with expected values.
     """
+    simple_gdf = simple_gdf.copy()
+
     simple_gdf['area_x'] = [1]
     simple_gdf['area_y'] = [2]
     simple_gdf['length'] = [1]
@@ -1108,6 +1440,8 @@ def test_calculate_greendex_missing_area_values(complex_gdf):
     - weight is calculated based on filled greendex values.
     - Row count of the output matches the input GeoDataFrame.
     """
+    complex_gdf = complex_gdf.copy()
+
     complex_gdf['area_x'] = [100,None,100]
     complex_gdf['area_y'] = [20,10,None]
     complex_gdf['length'] = [10, 20, 30]
@@ -1130,6 +1464,8 @@ def test_calculate_greendex_equal_lengths(complex_gdf):
     - greendex and weight are computed correctly using the fallback length normalization.
     - Row count of the output matches the input GeoDataFrame.
     """
+    complex_gdf = complex_gdf.copy()
+
     complex_gdf['area_x'] = [100,100,100]
     complex_gdf['area_y'] = [20,10,50]
     complex_gdf['length'] = [10, 10, 10]
@@ -1151,6 +1487,8 @@ def test_calculate_greendex_empty_input(empty_gdf):
     - 'greendex' and 'weight' columns are added to the empty GeoDataFrame.
     - The output GeoDataFrame remains empty.
     """
+    empty_gdf = empty_gdf.copy()
+
     empty_gdf['area_x'] = []
     empty_gdf['area_y'] = []
     empty_gdf['length'] = []
@@ -1168,6 +1506,8 @@ def test_calculate_greendex_area_x_missing(simple_gdf):
     Raises:
         ValueError: If the input GeoDataFrame is missing the 'area_x' column.
     """
+    simple_gdf = simple_gdf.copy()
+
     simple_gdf['area_y'] = [1]
     simple_gdf['length'] = [1]
 
@@ -1184,6 +1524,8 @@ def test_calculate_greendex_area_y_missing(simple_gdf):
     Raises:
         ValueError: If the input GeoDataFrame is missing the 'area_y' column.
     """
+    simple_gdf = simple_gdf.copy()
+
     simple_gdf['area_x'] = [1]
     simple_gdf['length'] = [1]
 
@@ -1,4 +1,5 @@
 import pytest
+from dataclasses import FrozenInstanceError
 from utils.inputs import UserInput, RoutingPreference
 
 """
@@ -28,15 +29,15 @@ Test categories:
         ]
 )
 def test_user_input_invalid_construction(sw_lat, sw_lon, ne_lat, ne_lon, expected_msg):
-        """
-        Test that invalid UserInput values raise the correct ValueError.
-        
-        Parameters are passed via pytest parametrize:
-        - sw_lat, sw_lon, ne_lat, ne_lon: coordinates
-        - expected_msg: expected ValueError message
-        """
-        with pytest.raises(ValueError, match=expected_msg):
-            user_input = UserInput(
+    """
+    Test that invalid UserInput values raise the correct ValueError.
+
+    Parameters are passed via pytest parametrize:
+    - sw_lat, sw_lon, ne_lat, ne_lon: coordinates
+    - expected_msg: expected ValueError message
+    """
+    with pytest.raises(ValueError) as exc_info:
+        UserInput(
             aoi_name = "test_aoi",
             sw_lat = sw_lat,
             sw_lon = sw_lon,
@@ -47,6 +48,8 @@ def test_user_input_invalid_construction(sw_lat, sw_lon, ne_lat, ne_lon, expecte
             routing_target = 2,
             routing_weight = RoutingPreference.SHORTEST)
 
+    assert str(exc_info.value) == expected_msg
+
 def test_user_input_valid_construction():
     """
     Test that UserInput can be created with valid coordinates and does not raise any exceptions.
@@ -61,3 +64,39 @@ def test_user_input_valid_construction():
         routing_source = 1,
         routing_target = 2,
         routing_weight = RoutingPreference.SHORTEST)
+
+def test_user_input_coerces_coordinates_to_float():
+    """
+    Test that integer coordinates and resolution are stored as floats after construction.
+    """
+    user_input = UserInput(
+        aoi_name = "test_aoi",
+        sw_lat = 0,
+        sw_lon = 0,
+        ne_lat = 1,
+        ne_lon = 1,
+        resolution = 1,
+        routing_source = 1,
+        routing_target = 2,
+        routing_weight = RoutingPreference.SHORTEST)
+
+    for val in [user_input.sw_lat, user_input.sw_lon, user_input.ne_lat, user_input.ne_lon, user_input.resolution]:
+        assert isinstance(val, float)
+
+def test_user_input_is_immutable():
+    """
+    Test that UserInput fields cannot be reassigned after validation.
+    """
+    user_input = UserInput(
+        aoi_name = "test_aoi",
+        sw_lat = 0,
+        sw_lon = 0,
+        ne_lat = 1,
+        ne_lon = 1,
+        resolution = 1,
+        routing_source = 1,
+        routing_target = 2,
+        routing_weight = RoutingPreference.SHORTEST)
+
+    with pytest.raises(FrozenInstanceError):
+        user_input.sw_lat = 5
@@ -0,0 +1,41 @@
+import pytest
+from utils.transformer import transformer_from_crs
+
+"""
+Tests for utils.transformer
+
+Function tested: transformer_from_crs(src_crs, dst_crs, always_xy)
+- Returns a pyproj Transformer for the CRS pair
+- Caches Transformers so repeated calls share one instance
+
+Test categories:
+- Normal cases: cached instance reuse, (x, y) axis order
+"""
+
+def test_transformer_from_crs_is_cached():
+    """
+    Request the same CRS pair twice.
+
+    Verify:
+    - The same Transformer instance is returned for identical arguments
+    - A different CRS pair returns a different Transformer
+    """
+    first = transformer_from_crs("EPSG:4326", "EPSG:3857")
+    second = transformer_from_crs("EPSG:4326", "EPSG:3857")
+    other = transformer_from_crs("EPSG:4326", "EPSG:5070")
+
+    assert first is second
+    assert first is not other
+
+def test_transformer_from_crs_always_xy():
+    """
+    Transform a lon/lat point to Web Mercator.
+
+    Verify:
+    - Input is interpreted as (lon, lat) by default
+    - The projected x coordinate matches one degree of longitude at the equator
+    """
+    x, y = transformer_from_crs("EPSG:4326", "EPSG:3857").transform(1, 0)
+
+    assert x == pytest.approx(111319.49, abs=0.01)
+    assert y == pytest.approx(0)